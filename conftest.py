@@ -1,11 +1,78 @@
+import json
+import time
+from pathlib import Path
+
 import pytest
 from playwright.sync_api import Page
+from pages.perf_budget import DEFAULT_PERF_BUDGET, parse_perf_budget
 from pages.register_page import RegisterPage
 
+PERF_BUDGET_KEY = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("performance", "client-side performance budget")
+    group.addoption(
+        "--perf-budget",
+        action="append",
+        default=[],
+        metavar="METRIC=MS",
+        help=f"Override a performance budget entry, e.g. --perf-budget load_ms=4000. "
+        f"Metrics: {', '.join(DEFAULT_PERF_BUDGET)}. Use 0 or less to disable a metric.",
+    )
+    group.addoption(
+        "--perf-trend-file",
+        default="reports/perf_trend.jsonl",
+        help="JSON Lines file the per-test performance metrics are appended to (default: %(default)s).",
+    )
+
+
+def _perf_budget(config) -> dict:
+    try:
+        return parse_perf_budget(config.getoption("--perf-budget"))
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+
+
+def pytest_configure(config):
+    # validate --perf-budget once, before any test runs
+    config.stash[PERF_BUDGET_KEY] = _perf_budget(config)
+
+
 @pytest.fixture
-def register_page(page: Page) -> RegisterPage:
+def register_page(page: Page, request) -> RegisterPage:
     """
     Provides a RegisterPage instance for tests. Tests should call register_page.goto()
     to navigate to the page before interacting with it.
+    Performance metrics collected by goto()/submit() are added to the report and appended to the trend file.
     """
-    return RegisterPage(page)
+    budget = request.config.stash.get(PERF_BUDGET_KEY, None)
+    if budget is None:
+        budget = request.config.stash[PERF_BUDGET_KEY] = _perf_budget(request.config)
+    rp = RegisterPage(page, perf_budget=budget)
+    request.node.perf_metrics = rp.perf_metrics
+    yield rp
+
+    if not rp.perf_metrics:
+        return
+    request.node.user_properties.append(("perf_metrics", json.dumps(rp.perf_metrics)))
+    trend_file = Path(request.config.getoption("--perf-trend-file"))
+    trend_file.parent.mkdir(parents=True, exist_ok=True)
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+    with trend_file.open("a", encoding="utf-8") as fh:
+        for metrics in rp.perf_metrics:
+            fh.write(json.dumps({"timestamp": timestamp, "test": request.node.nodeid, **metrics}) + "\n")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Attach the collected performance metrics to the pytest-html report of the test call."""
+    outcome = yield
+    report = outcome.get_result()
+    metrics = getattr(item, "perf_metrics", None)
+    pytest_html = item.config.pluginmanager.getplugin("html")
+    if report.when != "call" or not metrics or pytest_html is None:
+        return
+    extras = getattr(report, "extras", [])
+    extras.append(pytest_html.extras.json(metrics, name="Performance metrics"))
+    report.extras = extras
@@ -0,0 +1,32 @@
+from typing import Dict, Iterable
+
+# Default client-side performance budget in milliseconds (overridable via --perf-budget, see conftest.py).
+# A metric missing from the budget is recorded but never enforced.
+DEFAULT_PERF_BUDGET: Dict[str, float] = {
+    "ttfb_ms": 1500,
+    "dom_content_loaded_ms": 3000,
+    "load_ms": 5000,
+    "slowest_resource_ms": 3000,
+    "submit_to_redirect_ms": 3000,
+}
+
+
+def parse_perf_budget(entries: Iterable[str]) -> Dict[str, float]:
+    """
+    Build a budget from DEFAULT_PERF_BUDGET and METRIC=MS overrides; a value of 0 or less disables the metric.
+    Raises ValueError on an unknown metric or a non-numeric value.
+    """
+    budget = dict(DEFAULT_PERF_BUDGET)
+    for entry in entries:
+        key, sep, value = entry.partition("=")
+        if not sep or key not in DEFAULT_PERF_BUDGET:
+            raise ValueError(f"Invalid --perf-budget '{entry}'; expected METRIC=MS with METRIC in {list(DEFAULT_PERF_BUDGET)}")
+        try:
+            limit = float(value)
+        except ValueError:
+            raise ValueError(f"Invalid --perf-budget '{entry}'; '{value}' is not a number of milliseconds") from None
+        if limit > 0:
+            budget[key] = limit
+        else:
+            budget.pop(key, None)
+    return budget
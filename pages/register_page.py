@@ -1,8 +1,44 @@
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 import re
 from playwright.sync_api import Page, Locator, expect
+from pages.perf_budget import DEFAULT_PERF_BUDGET
 
 TARGET_URL = "https://qa-test-web-app.vercel.app/register.html"
+# Successful registration redirects here; submit-to-redirect latency is only measured for this URL.
+REGISTERED_URL_RE = re.compile(r"/index\.html\?registered=true")
+# sessionStorage key holding the Date.now() of the last Create Account click.
+SUBMIT_CLICKED_AT_KEY = "qaPerfSubmitClickedAt"
+
+# Extra time submit() waits for the redirect beyond the submit_to_redirect_ms budget, so a slow
+# redirect is measured and fails the budget instead of timing out.
+SUBMIT_BUDGET_MARGIN_MS = 2000
+
+# Single evaluate call returning Navigation Timing and Resource Timing for the current document.
+# Times are relative to the navigation start of the current document. origin_epoch and
+# clicked_at are both derived from Date.now() so the submit latency is computed on one clock.
+PERF_SNAPSHOT_JS = f"""() => {{
+    const clicked_at = sessionStorage.getItem('{SUBMIT_CLICKED_AT_KEY}');
+    sessionStorage.removeItem('{SUBMIT_CLICKED_AT_KEY}');
+    const nav = performance.getEntriesByType('navigation')[0];
+    const resources = performance.getEntriesByType('resource').map(r => ({{
+        name: r.name,
+        initiator_type: r.initiatorType,
+        duration_ms: r.duration,
+        transfer_size: r.transferSize || 0,
+    }}));
+    return {{
+        url: location.href,
+        origin_epoch: Date.now() - performance.now(),
+        clicked_at: clicked_at === null ? null : Number(clicked_at),
+        navigation: nav ? {{
+            ttfb_ms: nav.responseStart,
+            dom_content_loaded_ms: nav.domContentLoadedEventEnd,
+            load_ms: nav.loadEventEnd,
+            transfer_size: nav.transferSize || 0,
+        }} : null,
+        resources: resources,
+    }};
+}}"""
 
 
 class RegisterPage:
@@ -11,8 +47,13 @@ class RegisterPage:
     Provides stable-id based locators and high-level actions/assertions.
     """
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, perf_budget: Optional[Dict[str, float]] = None):
         self.page = page
+        self.perf_budget: Dict[str, float] = dict(DEFAULT_PERF_BUDGET if perf_budget is None else perf_budget)
+        # one entry per goto()/submit(), collected by the register_page fixture for the report and trend file
+        self.perf_metrics: List[Dict[str, Any]] = []
+        # navigation wait of the last submit(); a click older than this is not the one that led to the document
+        self._submit_wait_ms: float = 0
         # form
         self.form: Locator = page.locator("form#registerForm")
         # inputs (stable IDs from provided HTML)
@@ -63,6 +104,55 @@ class RegisterPage:
     def goto(self) -> None:
         self.page.goto(TARGET_URL)
         expect(self.form).to_be_visible()
+        self._record_perf("goto")
+
+    def _record_perf(self, step: str) -> Dict[str, Any]:
+        """
+        Collect timing metrics for the current document, store them in perf_metrics and
+        assert they are within perf_budget. When the document is the registered redirect
+        and a click timestamp was stored by submit(), submit_to_redirect_ms is the time
+        from the click until the new document finished loading.
+        """
+        snapshot = self.page.evaluate(PERF_SNAPSHOT_JS)
+        nav = snapshot["navigation"] or {}
+        resources = snapshot["resources"]
+        slowest = max(resources, key=lambda r: r["duration_ms"], default=None)
+
+        metrics: Dict[str, Any] = {
+            "step": step,
+            "url": snapshot["url"],
+            "ttfb_ms": nav.get("ttfb_ms"),
+            "dom_content_loaded_ms": nav.get("dom_content_loaded_ms"),
+            # loadEventEnd is 0 until the load handler finished
+            "load_ms": nav.get("load_ms") or None,
+            "resource_count": len(resources),
+            "transfer_kb": round((nav.get("transfer_size", 0) + sum(r["transfer_size"] for r in resources)) / 1024, 1),
+            "slowest_resource": slowest["name"] if slowest else None,
+            "slowest_resource_ms": slowest["duration_ms"] if slowest else None,
+            "submit_to_redirect_ms": None,
+        }
+        clicked_at = snapshot.get("clicked_at")
+        # the click must precede this document's navigation start by no more than the submit() wait
+        click_is_current = clicked_at is not None and 0 <= snapshot["origin_epoch"] - clicked_at <= self._submit_wait_ms
+        loaded_ms = metrics["load_ms"] or metrics["dom_content_loaded_ms"]
+        if click_is_current and loaded_ms and REGISTERED_URL_RE.search(metrics["url"]):
+            metrics["submit_to_redirect_ms"] = snapshot["origin_epoch"] + loaded_ms - clicked_at
+        for key, value in metrics.items():
+            if isinstance(value, float):
+                metrics[key] = round(value, 1)
+
+        metrics["budget_exceeded"] = {
+            key: metrics[key]
+            for key, limit in self.perf_budget.items()
+            if metrics.get(key) is not None and metrics[key] > limit
+        }
+        self.perf_metrics.append(metrics)
+
+        assert not metrics["budget_exceeded"], (
+            f"Performance budget exceeded on {step} ({metrics['url']}): "
+            + ", ".join(f"{k}={v}ms > {self.perf_budget[k]}ms" for k, v in metrics["budget_exceeded"].items())
+        )
+        return metrics
 
     def _one(self, key: str) -> Locator:
         """
@@ -146,15 +236,29 @@ class RegisterPage:
         """
         Click Create Account and attempt to wait for navigation. Returns navigation info if navigation happened,
         otherwise returns None. Caller may inspect register message separately.
+        Performance metrics are only recorded when navigation happened: without it the document,
+        and so its Navigation Timing, is the one goto() already recorded.
+        When the form is valid (the browser blocks invalid ones) and submit_to_redirect_ms is budgeted,
+        the wait is extended past the budget so a slow redirect fails the budget instead of timing out.
         """
         create_btn = self._one("create_button")
+        wait_ms = timeout
+        redirect_budget = self.perf_budget.get("submit_to_redirect_ms")
+        if redirect_budget is not None and self.form_is_valid():
+            wait_ms = max(timeout, redirect_budget + SUBMIT_BUDGET_MARGIN_MS)
+        self._submit_wait_ms = wait_ms
+        # click timestamp from the browser clock, read back by PERF_SNAPSHOT_JS on the next document
+        self.page.evaluate(
+            "key => sessionStorage.setItem(key, String(Date.now()))", SUBMIT_CLICKED_AT_KEY
+        )
         try:
-            with self.page.expect_navigation(timeout=timeout):
+            with self.page.expect_navigation(timeout=wait_ms):
                 create_btn.click()
-            return True
         except Exception:
-            # no navigation observed
+            # no navigation observed; a stale click timestamp is cleared by the next PERF_SNAPSHOT_JS
             return None
+        self._record_perf("submit")
+        return True
 
     def get_message_text(self) -> str:
         msg = self._one("message")
@@ -0,0 +1,152 @@
+from contextlib import contextmanager
+
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from pages.perf_budget import DEFAULT_PERF_BUDGET, parse_perf_budget
+from pages.register_page import PERF_SNAPSHOT_JS, SUBMIT_BUDGET_MARGIN_MS, RegisterPage
+
+REGISTERED_URL = "https://qa-test-web-app.vercel.app/index.html?registered=true"
+ORIGIN_EPOCH = 1_000_000.0
+
+
+class _StubLocator:
+    first = property(lambda self: self)
+
+    def count(self) -> int:
+        return 1
+
+    def click(self) -> None:
+        pass
+
+
+class _StubPage:
+    """
+    Minimal stand-in for playwright's Page: evaluate() returns a fixed performance snapshot and
+    expect_navigation() either succeeds or times out, recording the timeout it was given.
+    """
+
+    def __init__(self, snapshot: dict, navigates: bool = True, form_valid: bool = True):
+        self.snapshot = snapshot
+        self.navigates = navigates
+        self.form_valid = form_valid
+        self.navigation_timeouts = []
+
+    def locator(self, selector: str) -> _StubLocator:
+        return _StubLocator()
+
+    def evaluate(self, expression, arg=None):
+        if expression == PERF_SNAPSHOT_JS:
+            return self.snapshot
+        if "checkValidity" in expression:
+            return self.form_valid
+        return None
+
+    @contextmanager
+    def expect_navigation(self, timeout: float):
+        self.navigation_timeouts.append(timeout)
+        yield
+        if not self.navigates:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded.")
+
+
+def _snapshot(url: str = REGISTERED_URL, load_ms: float = 900.0, clicked_at=None) -> dict:
+    return {
+        "url": url,
+        "origin_epoch": ORIGIN_EPOCH,
+        "clicked_at": clicked_at,
+        "navigation": {
+            "ttfb_ms": 120.0,
+            "dom_content_loaded_ms": 600.0,
+            "load_ms": load_ms,
+            "transfer_size": 2048,
+        },
+        "resources": [
+            {"name": "app.js", "initiator_type": "script", "duration_ms": 250.0, "transfer_size": 1024},
+            {"name": "style.css", "initiator_type": "link", "duration_ms": 80.0, "transfer_size": 1024},
+        ],
+    }
+
+
+def test_record_perf_within_budget():
+    rp = RegisterPage(_StubPage(_snapshot()))
+    metrics = rp._record_perf("goto")
+
+    assert metrics["budget_exceeded"] == {}
+    assert metrics["slowest_resource"] == "app.js"
+    assert metrics["transfer_kb"] == 4.0
+    assert metrics["submit_to_redirect_ms"] is None
+    assert rp.perf_metrics == [metrics]
+
+
+def test_record_perf_raises_when_budget_exceeded():
+    rp = RegisterPage(_StubPage(_snapshot(load_ms=6000.0)))
+    with pytest.raises(AssertionError, match="load_ms=6000.0ms > 5000ms"):
+        rp._record_perf("goto")
+    # the metrics are still recorded for the report
+    assert rp.perf_metrics[0]["budget_exceeded"] == {"load_ms": 6000.0}
+
+
+def test_record_perf_ignores_disabled_metric():
+    rp = RegisterPage(_StubPage(_snapshot(load_ms=6000.0)), perf_budget=parse_perf_budget(["load_ms=0"]))
+    assert rp._record_perf("goto")["budget_exceeded"] == {}
+
+
+def test_submit_load_not_finished_falls_back_to_dom_content_loaded():
+    rp = RegisterPage(_StubPage(_snapshot(load_ms=0, clicked_at=ORIGIN_EPOCH - 400)))
+    assert rp.submit() is True
+    metrics = rp.perf_metrics[-1]
+    assert metrics["load_ms"] is None
+    # origin_epoch + dom_content_loaded_ms - clicked_at
+    assert metrics["submit_to_redirect_ms"] == 1000.0
+
+
+def test_submit_latency_only_for_registered_redirect():
+    snapshot = _snapshot(url="https://qa-test-web-app.vercel.app/login.html", clicked_at=ORIGIN_EPOCH - 400)
+    rp = RegisterPage(_StubPage(snapshot))
+    rp.submit()
+    assert rp.perf_metrics[-1]["submit_to_redirect_ms"] is None
+
+
+def test_submit_latency_ignores_stale_click():
+    stale = ORIGIN_EPOCH - DEFAULT_PERF_BUDGET["submit_to_redirect_ms"] - SUBMIT_BUDGET_MARGIN_MS - 1
+    rp = RegisterPage(_StubPage(_snapshot(clicked_at=stale)))
+    rp.submit()
+    assert rp.perf_metrics[-1]["submit_to_redirect_ms"] is None
+
+
+def test_submit_slow_redirect_fails_budget():
+    page = _StubPage(_snapshot(clicked_at=ORIGIN_EPOCH - 2500))
+    rp = RegisterPage(page)
+    with pytest.raises(AssertionError, match="submit_to_redirect_ms=3400.0ms"):
+        rp.submit(timeout=3000)
+    # the redirect is awaited past the budget, so it is measured instead of timing out
+    assert page.navigation_timeouts == [DEFAULT_PERF_BUDGET["submit_to_redirect_ms"] + SUBMIT_BUDGET_MARGIN_MS]
+
+
+def test_submit_timeout_returns_none_without_metrics():
+    page = _StubPage(_snapshot(), navigates=False)
+    rp = RegisterPage(page, perf_budget=parse_perf_budget(["submit_to_redirect_ms=5000"]))
+    assert rp.submit(timeout=3000) is None
+    assert page.navigation_timeouts == [5000 + SUBMIT_BUDGET_MARGIN_MS]
+    assert rp.perf_metrics == []
+
+
+def test_submit_invalid_form_keeps_caller_timeout():
+    page = _StubPage(_snapshot(), navigates=False, form_valid=False)
+    rp = RegisterPage(page)
+    assert rp.submit(timeout=1000) is None
+    assert page.navigation_timeouts == [1000]
+
+
+def test_parse_perf_budget_defaults_and_overrides():
+    assert parse_perf_budget([]) == DEFAULT_PERF_BUDGET
+
+    budget = parse_perf_budget(["load_ms=4000", "ttfb_ms=0", "ttfb_ms=0"])
+    assert budget["load_ms"] == 4000.0
+    assert "ttfb_ms" not in budget
+
+
+@pytest.mark.parametrize("entry", ["load_ms", "unknown_ms=100", "load_ms=abc"])
+def test_parse_perf_budget_rejects_bad_input(entry):
+    with pytest.raises(ValueError, match="Invalid --perf-budget"):
+        parse_perf_budget([entry])